@@ -0,0 +1,169 @@
+"""Keep built geometry on disk so unchanged parts load instead of rebuild."""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+import pickle
+from dataclasses import dataclass
+from functools import partial, wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar, cast
+
+import build123d
+
+from monobd.parallel import ShapeState, build_parallel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from build123d import Shape
+
+_ModelT = TypeVar("_ModelT")
+_GeometryT = TypeVar("_GeometryT")
+
+# Increment when the format of stored entries changes
+CACHE_VERSION = 1
+
+
+def cache_dir() -> Path:
+    """Return the directory cached geometry is stored in.
+
+    This is ``$MONOBD_CACHE_DIR`` if set, otherwise ``monobd`` within the
+    user cache directory (``$XDG_CACHE_HOME``, defaulting to ``~/.cache``).
+    Set ``$MONOBD_NO_CACHE`` to any non-empty value to disable the cache.
+    """
+    if env_dir := os.environ.get("MONOBD_CACHE_DIR"):
+        return Path(env_dir)
+    user_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(user_cache) / "monobd"
+
+
+@dataclass
+class CacheEntry:
+    """A shape to load from the disk cache, or build if it is missing.
+
+    Entries are keyed on the ``repr`` of ``key``, ``CACHE_VERSION``, the
+    build123d version and the contents of each dependency file, so editing
+    any source the shape is built from invalidates its entry.
+
+    Args:
+        key: Value identifying the shape, such as its build parameters.
+        build: Callable that builds the shape on a cache miss.
+        dependencies: Files the shape's geometry is derived from.
+    """
+
+    key: object
+    build: Callable[[], Shape]
+    dependencies: Sequence[Path | str] = ()
+
+    @property
+    def path(self) -> Path:
+        digest = hashlib.blake2b(repr(self.key).encode(), digest_size=16)
+        digest.update(f"{CACHE_VERSION}:{build123d.__version__}".encode())
+        for dependency in self.dependencies:
+            digest.update(Path(dependency).read_bytes())
+        return cache_dir() / f"{digest.hexdigest()}.pickle"
+
+
+def load_or_build(
+    key: object,
+    build: Callable[[], Shape],
+    dependencies: Iterable[Path | str] = (),
+) -> Shape:
+    """Load a shape from the disk cache, building and storing it if missing.
+
+    See ``CacheEntry`` for the arguments.
+    """
+    (shape,) = load_or_build_all([CacheEntry(key, build, tuple(dependencies))])
+    return shape
+
+
+def load_or_build_all(entries: Sequence[CacheEntry]) -> list[Shape]:
+    """Load each entry's shape from the disk cache, building any missing.
+
+    Entries are looked up in the calling process, and only the missing
+    shapes are passed to ``build_parallel``, so a fully cached build starts
+    no worker processes.
+    """
+    if os.environ.get("MONOBD_NO_CACHE"):
+        return build_parallel([entry.build for entry in entries])
+    paths = [entry.path for entry in entries]
+    shapes = {
+        i: shape
+        for i, path in enumerate(paths)
+        if (shape := _load(path)) is not None
+    }
+    misses = [i for i in range(len(entries)) if i not in shapes]
+    built = build_parallel(
+        [partial(_build_and_store, paths[i], entries[i].build) for i in misses]
+    )
+    shapes.update(zip(misses, built, strict=True))
+    return [shapes[i] for i in range(len(entries))]
+
+
+def _load(path: Path) -> Shape | None:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        return pickle.loads(data).load()  # noqa: S301
+    except Exception:  # noqa: BLE001
+        # Entries that fail to load are rebuilt and replaced
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _build_and_store(path: Path, build: Callable[[], Shape]) -> Shape:
+    shape = build()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    temp_path.write_bytes(pickle.dumps(ShapeState.dump(shape)))
+    temp_path.replace(path)
+    return shape
+
+
+def cached_build(
+    *dependencies: Path | str,
+) -> Callable[
+    [Callable[[_ModelT], _GeometryT]], Callable[[_ModelT], _GeometryT]
+]:
+    """Decorate a model's ``build`` method to cache its geometry on disk.
+
+    The model's ``repr``, which includes its class name and parameter values,
+    is used as the cache key. The module the model is defined in is always a
+    dependency. ``build`` must return a single shape, which is returned as a
+    plain ``Compound`` tree when loaded from the cache.
+
+    Args:
+        dependencies: Additional files the model's geometry is derived from.
+    """
+
+    def decorator(
+        build: Callable[[_ModelT], _GeometryT],
+    ) -> Callable[[_ModelT], _GeometryT]:
+        @wraps(build)
+        def wrapper(self: _ModelT) -> _GeometryT:
+            def build_shape() -> Shape:
+                shape = build(self)
+                if not isinstance(shape, build123d.Shape):
+                    raise TypeError(
+                        f"Cached build returned {type(shape).__name__},"
+                        " not a Shape"
+                    )
+                return shape
+
+            return cast(
+                "_GeometryT",
+                load_or_build(
+                    repr(self),
+                    build_shape,
+                    (inspect.getfile(type(self)), *dependencies),
+                ),
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,5 @@
+"""build123d models.
+
+Models may import build123d within ``build``, so that importing a model
+module to list its models and parameters does not load OCCT.
+"""
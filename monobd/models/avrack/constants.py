@@ -1,4 +1,6 @@
-from build123d import IN, MM
+# Same units as build123d
+MM = 1
+IN = 25.4 * MM
 
 FIT = 0.2 * MM
 LIP = 1.6 * MM
@@ -11,6 +13,14 @@ TRAY_WIDTH = 8.25 * IN
 TRAY_HEIGHT = 1 * U - (1 / 2 * IN)
 TRAY_FACE_SCREW_HORIZONTAL_SPACING = TRAY_WIDTH - (1 / 2) * IN
 TRAY_FACE_SCREW_VERTICAL_SPACING = TRAY_HEIGHT - (1 / 4) * IN
+TRAY_FACE_SCREW_LOCATIONS = tuple(
+    (
+        x * TRAY_FACE_SCREW_HORIZONTAL_SPACING / 2,
+        y * TRAY_FACE_SCREW_VERTICAL_SPACING / 2,
+    )
+    for x in (-1, 1)
+    for y in (-1, 1)
+)
 TRAY_FACE_HEIGHT = 1 * U - (1 / 8 * IN)
 TRAY_EAR_WIDTH = 1 / 2 * IN
 THICKNESS = 1 / 8 * IN
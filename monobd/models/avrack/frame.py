@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from copy import copy
 from enum import Enum, auto
+from functools import cache, partial
 
 from build123d import (
     IN,
@@ -16,20 +18,23 @@ from build123d import (
     Hole,
     Locations,
     Mode,
+    Part,
     Plane,
     Rectangle,
     RectangleRounded,
     RotationLike,
     Select,
+    Shape,
     add,
     chamfer,
     extrude,
     fillet,
     loft,
-    mirror,
     validate_inputs,
 )
 
+from monobd.cache import CacheEntry, load_or_build_all
+
 from . import constants
 
 
@@ -37,6 +42,26 @@ class RackMountWhichHalf(Enum):
     LEFT = auto()
     RIGHT = auto()
 
+    @property
+    def direction(self) -> int:
+        """Sign of the X axis pointing from the rack center to this half."""
+        return -1 if self == RackMountWhichHalf.LEFT else 1
+
+    @property
+    def inner_align(self) -> Align:
+        """X alignment placing this half's inner end at the origin."""
+        return Align.MAX if self == RackMountWhichHalf.LEFT else Align.MIN
+
+    @property
+    def inner_index(self) -> int:
+        """Index of this half's inner end in shapes grouped along X."""
+        return -1 if self == RackMountWhichHalf.LEFT else 0
+
+    @property
+    def outer_index(self) -> int:
+        """Index of this half's outer end in shapes grouped along X."""
+        return 0 if self == RackMountWhichHalf.LEFT else -1
+
 
 class RackFrame(Compound):
     def __init__(self, label: str = "frame") -> None:
@@ -81,162 +106,143 @@ class RackHoles(BasePartObject):
         )
 
 
-class RackFrameHalf(BasePartObject):
-    def __init__(
-        self,
-        half: RackMountWhichHalf = RackMountWhichHalf.LEFT,
-        rotation: RotationLike = (0, 0, 0),
-        align: tuple[Align, Align, Align] | None = None,
-        mode: Mode = Mode.ADD,
-    ) -> None:
-        outer_height = 1 * constants.U - constants.FIT * 2
-        shift_direction = -1 if (half == RackMountWhichHalf.LEFT) else 1
-        part_width = 19 / 2 * IN
-        part_shift = shift_direction * (part_width - (17 + 1 / 4) / 2 * IN) / 2
-        with BuildPart() as p:
-            with BuildPart(mode=Mode.PRIVATE) as face_plate:
-                with BuildSketch() as sk0:
-                    Rectangle(part_width, outer_height)
-                front_plate = extrude(
-                    sk0.sketch, amount=constants.FACE_THICKNESS
-                )
-                fillet(
-                    face_plate.edges(Select.LAST)
-                    .group_by(Axis.Z)[1]
-                    .group_by(Axis.X)[
-                        0 if half == RackMountWhichHalf.LEFT else -1
-                    ],
-                    radius=1 / 8 * IN,
-                )
-                chamfer(face_plate.edges(Select.LAST).group_by(Axis.Z)[0], 1)
-                front_plate_back_face = front_plate.faces().group_by(Axis.Z)[
-                    -1
-                ]
-                holes_inset = part_width - (18 + 5 / 16) / 2 * IN
-                with Locations(
-                    (shift_direction * (part_width / 2 - holes_inset), 0, 0)
-                ):
-                    RackHoles(mode=Mode.SUBTRACT)
-                chamfer(
-                    list(face_plate.edges(Select.LAST).group_by(Axis.Z)), 0.4
-                )
-
-                back_width = part_width - abs(part_shift * 2)
-                with (
-                    BuildSketch(front_plate_back_face) as sk,
-                    Locations((-part_shift, 0, constants.THICKNESS * 2)),
-                ):
-                    Rectangle(back_width, outer_height)
-                with (
-                    BuildSketch(
-                        sk.faces()[0].offset(constants.THICKNESS * 10)
-                    ) as sk2,
-                    Locations((-shift_direction * back_width / 2, 0)),
-                ):
-                    Rectangle(
-                        (2 + 5 / 8) * IN,
-                        outer_height,
-                        align=(
-                            (
-                                Align.MAX
-                                if half == RackMountWhichHalf.LEFT
-                                else Align.MIN
-                            ),
-                            Align.CENTER,
-                        ),
-                    )
-                ll = loft([sk.sketch, sk2.sketch])
-                fillet(ll.edges().group_by(Axis.Z)[-1], 10 * IN)
-                fillet(ll.edges().group_by(Axis.Z)[0], 0.25 * IN)
-                chamfer(
-                    face_plate.edges()
-                    .group_by(Axis.X)[
-                        0 if half == RackMountWhichHalf.LEFT else -1
-                    ]
-                    .group_by(Axis.Z)[2],
-                    1,
-                )
+@cache
+def _build_frame_halves() -> dict[RackMountWhichHalf, Shape]:
+    halves = list(RackMountWhichHalf)
+    parts = load_or_build_all([_frame_half_cache_entry(h) for h in halves])
+    return dict(zip(halves, parts, strict=True))
+
+
+def _frame_half_cache_entry(half: RackMountWhichHalf) -> CacheEntry:
+    return CacheEntry(
+        ("frame-half", half.name),
+        partial(_build_frame_half, half),
+        (__file__, constants.__file__),
+    )
+
+
+def _build_frame_half(half: RackMountWhichHalf) -> Part:
+    outer_height = 1 * constants.U - constants.FIT * 2
+    part_width = 19 / 2 * IN
+    part_shift = half.direction * (part_width - (17 + 1 / 4) / 2 * IN) / 2
+    with BuildPart() as p:
+        with BuildPart(mode=Mode.PRIVATE) as face_plate:
+            with BuildSketch() as sk0:
+                Rectangle(part_width, outer_height)
+            front_plate = extrude(sk0.sketch, amount=constants.FACE_THICKNESS)
+            fillet(
+                face_plate.edges(Select.LAST)
+                .group_by(Axis.Z)[1]
+                .group_by(Axis.X)[half.outer_index],
+                radius=1 / 8 * IN,
+            )
+            chamfer(face_plate.edges(Select.LAST).group_by(Axis.Z)[0], 1)
+            front_plate_back_face = front_plate.faces().group_by(Axis.Z)[-1]
+            holes_inset = part_width - (18 + 5 / 16) / 2 * IN
+            with Locations(
+                (half.direction * (part_width / 2 - holes_inset), 0, 0)
+            ):
+                RackHoles(mode=Mode.SUBTRACT)
+            chamfer(list(face_plate.edges(Select.LAST).group_by(Axis.Z)), 0.4)
 
-            with Locations((part_shift, 0, 0)):
-                add(face_plate)
-
-            # Tray cutout
-            with BuildSketch() as sk:
-                RectangleRounded(
-                    constants.TRAY_WIDTH
-                    - constants.TRAY_EAR_WIDTH * 2
-                    + constants.FIT,
-                    constants.TRAY_HEIGHT + constants.FIT,
-                    radius=1 / 8 * IN + constants.FIT,
+            back_width = part_width - abs(part_shift * 2)
+            with (
+                BuildSketch(front_plate_back_face) as sk,
+                Locations((-part_shift, 0, constants.THICKNESS * 2)),
+            ):
+                Rectangle(back_width, outer_height)
+            with (
+                BuildSketch(
+                    Plane(sk.faces()[0]).offset(constants.THICKNESS * 10)
+                ) as sk2,
+                Locations((-half.direction * back_width / 2, 0)),
+            ):
+                Rectangle(
+                    (2 + 5 / 8) * IN,
+                    outer_height,
+                    align=(half.inner_align, Align.CENTER),
                 )
-            tray_cutout = extrude(
-                sk.sketch,
-                amount=constants.FACE_THICKNESS + constants.THICKNESS * 10,
-                mode=Mode.SUBTRACT,
+            ll = loft([sk.sketch, sk2.sketch])
+            loft_edges = ll.edges().group_by(Axis.Z)
+            fillet(loft_edges[-1], 10 * IN)
+            fillet(loft_edges[0], 0.25 * IN)
+            chamfer(
+                face_plate.edges()
+                .group_by(Axis.X)[half.outer_index]
+                .group_by(Axis.Z)[2],
+                1,
             )
-            chamfer(list(p.edges(Select.LAST).group_by(Axis.Z)), 1)
 
+        with Locations((part_shift, 0, 0)):
+            add(face_plate)
+
+        # Tray cutout
+        with BuildSketch() as sk:
+            RectangleRounded(
+                constants.TRAY_WIDTH
+                - constants.TRAY_EAR_WIDTH * 2
+                + constants.FIT,
+                constants.TRAY_HEIGHT + constants.FIT,
+                radius=1 / 8 * IN + constants.FIT,
+            )
+        tray_cutout = extrude(
+            sk.sketch,
+            amount=constants.FACE_THICKNESS + constants.THICKNESS * 10,
+            mode=Mode.SUBTRACT,
+        )
+        chamfer(list(p.edges(Select.LAST).group_by(Axis.Z)), 1)
+
+        # Tray side screw holes
+        ff = tray_cutout.faces().group_by(Axis.X)[half.inner_index]
+        with (
+            Locations(Plane(ff[0]).reverse()),
+            GridLocations(5 / 16 * constants.U, constants.THICKNESS * 4, 2, 2),
+        ):
             if half == RackMountWhichHalf.LEFT:
-                ff = tray_cutout.faces().group_by(Axis.X)[-1]
-                with (
-                    Locations(ff),
-                    GridLocations(
-                        5 / 16 * constants.U, constants.THICKNESS * 4, 2, 2
-                    ),
-                ):
-                    hh = CounterBoreHole(
-                        radius=constants.SCREW_HOLE_DIAMETER / 2,
-                        counter_bore_radius=constants.SCREW_DIAMETER,
-                        counter_bore_depth=constants.SCREW_DIAMETER * 1.25,
-                        depth=part_width / 2,
-                        mode=Mode.PRIVATE,
-                    )
-                    mirror(hh, about=Plane(ff[0]), mode=Mode.SUBTRACT)
-            elif half == RackMountWhichHalf.RIGHT:
-                ff = tray_cutout.faces().group_by(Axis.X)[0]
-                with (
-                    Locations(ff),
-                    GridLocations(
-                        5 / 16 * constants.U, constants.THICKNESS * 4, 2, 2
-                    ),
-                ):
-                    hh = Hole(
-                        radius=constants.SCREW_INSERT_DIAMETER / 2,
-                        depth=part_width / 2,
-                        mode=Mode.PRIVATE,
-                    )
-                    mirror(hh, about=Plane(ff[0]), mode=Mode.SUBTRACT)
-                    chamfer(list(p.edges(Select.LAST).group_by(Axis.X)), 1)
-
-            # Tray screw holes
-            with GridLocations(
-                constants.TRAY_FACE_SCREW_HORIZONTAL_SPACING,
-                constants.TRAY_FACE_SCREW_VERTICAL_SPACING,
-                2,
-                2,
-            ):
+                CounterBoreHole(
+                    radius=constants.SCREW_HOLE_DIAMETER / 2,
+                    counter_bore_radius=constants.SCREW_DIAMETER,
+                    counter_bore_depth=constants.SCREW_DIAMETER * 1.25,
+                    depth=part_width / 2,
+                )
+            else:
                 Hole(
                     radius=constants.SCREW_INSERT_DIAMETER / 2,
-                    mode=Mode.SUBTRACT,
+                    depth=part_width / 2,
                 )
-                chamfer(list(p.edges(Select.LAST).group_by(Axis.Z)), 1)
+        if half == RackMountWhichHalf.RIGHT:
+            chamfer(list(p.edges(Select.LAST).group_by(Axis.X)), 1)
 
-        if not p.part:
-            raise RuntimeError("Empty part")
-        p.part.label = f"half-{half.name.lower()}"
+        # Tray screw holes
+        with Locations(*constants.TRAY_FACE_SCREW_LOCATIONS):
+            Hole(
+                radius=constants.SCREW_INSERT_DIAMETER / 2,
+                mode=Mode.SUBTRACT,
+            )
+        chamfer(list(p.edges(Select.LAST).group_by(Axis.Z)), 1)
+
+    if not p.part:
+        raise RuntimeError("Empty part")
+    p.part.label = f"half-{half.name.lower()}"
+    return p.part
+
+
+class RackFrameHalf(BasePartObject):
+    def __init__(
+        self,
+        half: RackMountWhichHalf = RackMountWhichHalf.LEFT,
+        rotation: RotationLike = (0, 0, 0),
+        align: tuple[Align, Align, Align] | None = None,
+        mode: Mode = Mode.ADD,
+    ) -> None:
+        # Halves built by workers or loaded from the cache are plain
+        # compounds
+        shape = copy(_build_frame_halves()[half])
         super().__init__(
-            part=p.part,
+            part=Part(shape.wrapped, label=shape.label),
             rotation=rotation,
             align=(
-                (
-                    (
-                        Align.MAX
-                        if half == RackMountWhichHalf.LEFT
-                        else Align.MIN
-                    ),
-                    Align.CENTER,
-                    Align.MIN,
-                )
+                (half.inner_align, Align.CENTER, Align.MIN)
                 if align is None
                 else align
             ),
@@ -1,20 +1,31 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import cached_property
+from dataclasses import dataclass, replace
+from functools import cache, cached_property, partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from bdbox import Model
-from build123d import IN, Color, Compound, Location
 
 from . import constants
 from .assets import asset
-from .frame import RackFrame
-from .tray import RackTray
+from .constants import IN
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
-    from pathlib import Path
+    from build123d import Location
+
+    from monobd.cache import CacheEntry
+
+
+@cache
+def _tray_location(index: int) -> Location:
+    from build123d import Location  # noqa: PLC0415
+
+    # Trays beyond the frame slots are shown one rack unit apart above it
+    drop = Location((0, 0, -constants.THICKNESS))
+    if index < len(constants.TRAY_LOCATIONS):
+        return Location(constants.TRAY_LOCATIONS[index]) * drop
+    return Location((0, constants.U * (index - 1), 0)) * drop
 
 
 @dataclass
@@ -25,12 +36,40 @@ class TrayConfig:
     image_file: Path | None
 
 
+def _tray_cache_entry(config: TrayConfig, *, simple: bool) -> CacheEntry:
+    from monobd.cache import CacheEntry  # noqa: PLC0415
+
+    from .tray import SOURCES, RackTray  # noqa: PLC0415
+
+    # The simple variant skips decorative cuts: hex patterns and face images
+    image_file = None if simple else config.image_file
+    # Key on the image path within the package so that entries are shared
+    # between checkouts
+    key_config = replace(
+        config,
+        image_file=config.image_file
+        and config.image_file.relative_to(Path(__file__).parent),
+    )
+    return CacheEntry(
+        ("tray", key_config, simple),
+        partial(
+            RackTray,
+            label=config.label,
+            device_size=config.device_size,
+            cutout_size=config.cutout_size,
+            image_file=image_file or "",
+            hexagon_pattern=not simple,
+        ),
+        (__file__, *SOURCES, *filter(None, [image_file])),
+    )
+
+
 class AVRack(Model):
     simple: bool = False
 
     @cached_property
-    def trays_config(self) -> Iterator[TrayConfig]:
-        yield from [
+    def trays_config(self) -> list[TrayConfig]:
+        return [
             TrayConfig(
                 label="ethernet-switch",
                 device_size=((6 + 5 / 16) * IN, (1 + 1 / 32) * IN, 4 * IN),
@@ -56,22 +95,21 @@ class AVRack(Model):
         ]
 
     def build(self) -> Model.Geometry:
+        from build123d import Color, Compound  # noqa: PLC0415
+
+        from monobd.cache import load_or_build_all  # noqa: PLC0415
+
+        from .frame import RackFrame  # noqa: PLC0415
+
         frame = RackFrame()
-        trays = [
-            RackTray(
-                label=c.label,
-                device_size=c.device_size,
-                cutout_size=c.cutout_size,
-                image_file=c.image_file or "",
-                hexagon_pattern=not self.simple,
-            ).move(Location((0, 0, -constants.THICKNESS)))
-            for c in self.trays_config
-        ]
-        for tray in trays:
+        trays = load_or_build_all(
+            [
+                _tray_cache_entry(c, simple=self.simple)
+                for c in self.trays_config
+            ]
+        )
+        for i, tray in enumerate(trays):
             tray.color = Color(0xAAAAAA, alpha=0xFF)
-        for i, loc in enumerate(constants.TRAY_LOCATIONS):
-            trays[i] = trays[i].move(Location(loc))
-        for i in range(2, len(trays)):
-            trays[i] = trays[i].move(Location((0, constants.U * (i - 1), 0)))
+            tray.move(_tray_location(i))
         trays_assembly = Compound(label="trays", children=trays)
         return Compound(label="avrack", children=[frame, trays_assembly])
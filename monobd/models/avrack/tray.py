@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from copy import copy
+from functools import cache
+from pathlib import Path
 
 from build123d import (
     IN,
@@ -12,7 +14,6 @@ from build123d import (
     BuildSketch,
     Circle,
     Compound,
-    GridLocations,
     Hole,
     Locations,
     Mode,
@@ -20,17 +21,89 @@ from build123d import (
     RectangleRounded,
     RotationLike,
     Select,
+    Sketch,
     SortBy,
+    add,
     chamfer,
     extrude,
 )
 
+from monobd import objects
 from monobd.objects import HexagonPattern, PrintableCounterBoreHole, SVGSketch
 
 from . import constants
 
-if TYPE_CHECKING:
-    from pathlib import Path
+SOURCES = (
+    Path(__file__),
+    Path(constants.__file__),
+    *sorted(Path(objects.__file__).parent.glob("*.py")),
+)
+
+
+@cache
+def _tray_face_blank() -> Sketch:
+    with BuildSketch() as sk:
+        RectangleRounded(
+            constants.TRAY_WIDTH,
+            constants.TRAY_FACE_HEIGHT,
+            radius=(1 / 8) * IN,
+        )
+        with Locations(*constants.TRAY_FACE_SCREW_LOCATIONS):
+            Circle(
+                radius=constants.SCREW_HOLE_DIAMETER / 2,
+                mode=Mode.SUBTRACT,
+            )
+    return sk.sketch
+
+
+@cache
+def _tray_outline(dev_width: float, dev_height: float) -> Sketch:
+    with BuildSketch() as sk:
+        RectangleRounded(
+            dev_width
+            + constants.WALL_THICKNESS * 2
+            + constants.SCREW_SUPPORT_DIAMETER * 2,
+            min(
+                constants.TRAY_HEIGHT,
+                dev_height + constants.WALL_THICKNESS * 2,
+            ),
+            radius=(1 / 8) * IN,
+        )
+    return sk.sketch
+
+
+@cache
+def _tray_screw_locations(
+    dev_width: float, dev_height: float
+) -> tuple[tuple[float, float], ...]:
+    spacing_x = (
+        dev_width + constants.WALL_THICKNESS + constants.SCREW_SUPPORT_DIAMETER
+    )
+    spacing_y = (
+        dev_height
+        + constants.WALL_THICKNESS * 2
+        - constants.SCREW_SUPPORT_DIAMETER * 2
+    )
+    return tuple(
+        (x * spacing_x / 2, y * spacing_y / 2)
+        for x in (-1, 1)
+        for y in (-1, 1)
+    )
+
+
+@cache
+def _hexagon_pattern(
+    width: float, height: float, hex_size: float, *, whole_only: bool
+) -> Sketch:
+    with BuildSketch() as sk:
+        HexagonPattern(
+            width,
+            height,
+            hex_size=hex_size,
+            whole_only=whole_only,
+            align=(Align.CENTER, Align.CENTER),
+        )
+    return sk.sketch
 
 
 class RackTrayFront(BasePartObject):
@@ -50,33 +123,20 @@ class RackTrayFront(BasePartObject):
         self.dev_width, self.dev_height, self.dev_depth = device_size
         with BuildPart() as p:
             with BuildSketch() as sk:
-                RectangleRounded(
-                    constants.TRAY_WIDTH,
-                    constants.TRAY_FACE_HEIGHT,
-                    radius=(1 / 8) * IN,
-                )
+                add(copy(_tray_face_blank()))
                 RectangleRounded(
                     *cutout_size, radius=(1 / 8) * IN, mode=Mode.SUBTRACT
                 )
-                with GridLocations(
-                    constants.TRAY_FACE_SCREW_HORIZONTAL_SPACING,
-                    constants.TRAY_FACE_SCREW_VERTICAL_SPACING,
-                    2,
-                    2,
-                ):
-                    Circle(
-                        radius=constants.SCREW_HOLE_DIAMETER / 2,
-                        mode=Mode.SUBTRACT,
-                    )
             extrude(sk.sketch, amount=constants.THICKNESS)
-            for face_index in [-1, 0]:
-                for distance_index in [-1, 0]:
-                    chamfer(
-                        p.edges()
-                        .group_by(Axis.Z)[face_index]
-                        .sort_by(SortBy.DISTANCE)[distance_index],
-                        length=constants.THICKNESS / 4,
-                    )
+            edge_groups = p.edges().group_by(Axis.Z)
+            face_edges = [
+                edge_groups[face_index].sort_by(SortBy.DISTANCE)
+                for face_index in [-1, 0]
+            ]
+            chamfer(
+                [edges[i] for edges in face_edges for i in [-1, 0]],
+                length=constants.THICKNESS / 4,
+            )
             if image_file:
                 image_space = min(
                     constants.TRAY_FACE_HEIGHT,
@@ -113,31 +173,16 @@ class RackTrayBody(BasePartObject):
         self.dev_width, self.dev_height, self.dev_depth = device_size
         depth = self.dev_depth + constants.LIP + (1 * MM)
         with BuildPart() as p:
-            with BuildSketch() as sk:
-                RectangleRounded(
-                    self.dev_width
-                    + constants.WALL_THICKNESS * 2
-                    + constants.SCREW_SUPPORT_DIAMETER * 2,
-                    min(
-                        constants.TRAY_HEIGHT,
-                        self.dev_height + constants.WALL_THICKNESS * 2,
-                    ),
-                    radius=(1 / 8) * IN,
-                )
-            body = extrude(sk.sketch, amount=depth)
+            body = extrude(
+                _tray_outline(self.dev_width, self.dev_height), amount=depth
+            )
+            body_faces = body.faces()
 
             # Screw holes
             with (
-                Locations(body.faces().sort_by(Axis.Z)[-1]),
-                GridLocations(
-                    self.dev_width
-                    + constants.WALL_THICKNESS
-                    + constants.SCREW_SUPPORT_DIAMETER,
-                    self.dev_height
-                    + constants.WALL_THICKNESS * 2
-                    - constants.SCREW_SUPPORT_DIAMETER * 2,
-                    2,
-                    2,
+                Locations(body_faces.sort_by(Axis.Z)[-1]),
+                Locations(
+                    *_tray_screw_locations(self.dev_width, self.dev_height)
                 ),
             ):
                 Hole(
@@ -146,42 +191,69 @@ class RackTrayBody(BasePartObject):
                 )
             chamfer(p.edges(Select.LAST).group_by(Axis.Z)[-1], length=1)
 
-            # Hex pattern
+            # Hex pattern, skipping sides too small to fit a hexagon. The
+            # prisms for every side are cut from the body together.
             if hexagon_pattern:
-                for yf in [body.faces().sort_by(Axis.Y)[i] for i in (-1, 0)]:
-                    with BuildSketch(yf) as sk:
-                        HexagonPattern(
-                            self.dev_width - constants.WALL_THICKNESS * 2,
-                            depth - constants.THICKNESS * 2,
-                            whole_only=True,
-                            align=(Align.CENTER, Align.CENTER),
-                            mode=Mode.ADD,
+                hex_cutouts = []
+                side_size = (
+                    self.dev_width - constants.WALL_THICKNESS * 2,
+                    depth - constants.THICKNESS * 2,
+                )
+                side_hex_size = 8
+                if HexagonPattern.fits(
+                    *side_size, hex_size=side_hex_size, whole_only=True
+                ):
+                    y_faces = body_faces.sort_by(Axis.Y)
+                    for yf in (y_faces[-1], y_faces[0]):
+                        with BuildSketch(yf) as sk:
+                            add(
+                                copy(
+                                    _hexagon_pattern(
+                                        *side_size,
+                                        hex_size=side_hex_size,
+                                        whole_only=True,
+                                    )
+                                )
+                            )
+                        hex_cutouts.append(
+                            extrude(
+                                sk.sketch,
+                                amount=-constants.WALL_THICKNESS,
+                                mode=Mode.PRIVATE,
+                            )
                         )
-                    extrude(
-                        sk.sketch,
-                        amount=-constants.WALL_THICKNESS,
-                        mode=Mode.SUBTRACT,
-                    )
-                for yf in [body.faces().sort_by(Axis.X)[i] for i in (-1, 0)]:
-                    with BuildSketch(yf) as sk:
-                        HexagonPattern(
-                            self.dev_height - constants.WALL_THICKNESS * 1,
-                            depth
-                            - constants.THICKNESS * 2
-                            - constants.SCREW_SUPPORT_DIAMETER * 2,
-                            whole_only=False,
-                            hex_size=6,
-                            align=(Align.CENTER, Align.CENTER),
-                            mode=Mode.ADD,
+                end_size = (
+                    self.dev_height - constants.WALL_THICKNESS * 1,
+                    depth
+                    - constants.THICKNESS * 2
+                    - constants.SCREW_SUPPORT_DIAMETER * 2,
+                )
+                end_hex_size = 6
+                if HexagonPattern.fits(*end_size, hex_size=end_hex_size):
+                    x_faces = body_faces.sort_by(Axis.X)
+                    for yf in (x_faces[-1], x_faces[0]):
+                        with BuildSketch(yf) as sk:
+                            add(
+                                copy(
+                                    _hexagon_pattern(
+                                        *end_size,
+                                        hex_size=end_hex_size,
+                                        whole_only=False,
+                                    )
+                                )
+                            )
+                        hex_cutouts.append(
+                            extrude(
+                                sk.sketch,
+                                amount=-(
+                                    constants.WALL_THICKNESS
+                                    + constants.SCREW_SUPPORT_DIAMETER
+                                ),
+                                mode=Mode.PRIVATE,
+                            )
                         )
-                    extrude(
-                        sk.sketch,
-                        amount=-(
-                            constants.WALL_THICKNESS
-                            + constants.SCREW_SUPPORT_DIAMETER
-                        ),
-                        mode=Mode.SUBTRACT,
-                    )
+                if hex_cutouts:
+                    add(hex_cutouts, mode=Mode.SUBTRACT)
 
         if not p.part:
             raise RuntimeError("Empty part")
@@ -205,20 +277,13 @@ class RackTrayBack(BasePartObject):
     ) -> None:
         self.dev_width, self.dev_height, self.dev_depth = device_size
         with BuildPart() as p:
-            with BuildSketch() as sk:
-                RectangleRounded(
-                    self.dev_width
-                    + constants.WALL_THICKNESS * 2
-                    + constants.SCREW_SUPPORT_DIAMETER * 2,
-                    min(
-                        constants.TRAY_HEIGHT,
-                        self.dev_height + constants.WALL_THICKNESS * 2,
-                    ),
-                    radius=(1 / 8) * IN,
-                )
-            back = extrude(sk.sketch, amount=constants.THICKNESS)
+            back = extrude(
+                _tray_outline(self.dev_width, self.dev_height),
+                amount=constants.THICKNESS,
+            )
+            back_faces = back.faces().sort_by(Axis.Z)
             chamfer(p.edges(Select.LAST).sort_by(Axis.Z)[-1], length=1)
-            with BuildSketch(back.faces().sort_by(Axis.Z)[0]) as sk:
+            with BuildSketch(back_faces[0]) as sk:
                 RectangleRounded(
                     self.dev_width - constants.FIT,
                     min(constants.TRAY_HEIGHT, self.dev_height)
@@ -227,7 +292,7 @@ class RackTrayBack(BasePartObject):
                 )
             extrude(sk.sketch, amount=constants.LIP)
             chamfer(p.edges(Select.LAST).sort_by(Axis.Z)[0], length=0.6 * MM)
-            with BuildSketch(back.faces().sort_by(Axis.Z)[-1]) as sk:
+            with BuildSketch(back_faces[-1]) as sk:
                 RectangleRounded(*cutout_size, radius=(1 / 8) * IN)
             extrude(
                 sk.sketch,
@@ -236,16 +301,9 @@ class RackTrayBack(BasePartObject):
             )
             chamfer(p.edges(Select.LAST).sort_by(Axis.Z)[:], length=0.6 * MM)
             with (
-                Locations(back.faces().sort_by(Axis.Z)[-1]),
-                GridLocations(
-                    self.dev_width
-                    + constants.WALL_THICKNESS
-                    + constants.SCREW_SUPPORT_DIAMETER,
-                    self.dev_height
-                    + constants.WALL_THICKNESS * 2
-                    - constants.SCREW_SUPPORT_DIAMETER * 2,
-                    2,
-                    2,
+                Locations(back_faces[-1]),
+                Locations(
+                    *_tray_screw_locations(self.dev_width, self.dev_height)
                 ),
             ):
                 PrintableCounterBoreHole(
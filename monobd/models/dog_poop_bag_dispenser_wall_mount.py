@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from copy import copy
+from functools import cache
 from operator import itemgetter
 
 from bdbox import Inches, Model
@@ -24,7 +26,9 @@ from build123d import (
     Rectangle,
     RotationLike,
     Select,
+    Sketch,
     ThreePointArc,
+    add,
     chamfer,
     extrude,
     fillet,
@@ -32,6 +36,8 @@ from build123d import (
     mirror,
 )
 
+from monobd.cache import cached_build
+
 first_and_last = itemgetter(0, -1)
 
 
@@ -67,10 +73,11 @@ class DispenserOutline(BaseSketchObject):
                     mode=Mode.SUBTRACT,
                 )
             fillet(
-                sk.vertices()
-                .sort_by_distance((0, 0))
-                .filter_by_position(Axis.X, -radius, radius)
-                .filter_by_position(Axis.Y, -radius, radius),
+                [
+                    v
+                    for v in sk.vertices()
+                    if abs(v.X) <= radius and abs(v.Y) <= radius
+                ],
                 radius=thickness / 2,
             )
         super().__init__(
@@ -78,6 +85,41 @@ class DispenserOutline(BaseSketchObject):
         )
 
 
+@cache
+def _dispenser_cutout_outline() -> Sketch:
+    opening_length = (2 + 1 / 4) * IN
+    opening_width = (1 / 2) * IN
+    with BuildSketch() as sk:
+        with BuildLine():
+            hl = (opening_length - opening_width) / 2
+            cutl = hl / 4
+            cutw = opening_width / 4
+            Polyline(
+                (0, hl),
+                (0, cutw + cutl),
+                (cutw, cutl),
+                (cutw, 0),
+                (opening_width - cutw, 0),
+                (opening_width - cutw, cutl),
+                (opening_width, cutl + cutw),
+                (opening_width, hl),
+            )
+            ThreePointArc(
+                (opening_width, hl),
+                (opening_width / 2, hl + opening_width / 2),
+                (0, hl),
+            )
+        make_face()
+        fillet(
+            sk.vertices()
+            .sort_by(Axis.Y)
+            .filter_by_position(Axis.Y, 0, hl, inclusive=(False, False)),
+            radius=cutw,
+        )
+        mirror(sk.sketch, about=Plane.XZ)
+    return sk.sketch
+
+
 class DispenserCutout(BasePartObject):
     def __init__(
         self,
@@ -92,39 +134,8 @@ class DispenserCutout(BasePartObject):
         mode: Mode = Mode.ADD,
         depth: float | None = None,  # noqa: ARG002
     ) -> None:
-        opening_length = (2 + 1 / 4) * IN
-        opening_width = (1 / 2) * IN
         with BuildPart() as p:
-            with BuildSketch() as sk:
-                with BuildLine():
-                    hl = (opening_length - opening_width) / 2
-                    cutl = hl / 4
-                    cutw = opening_width / 4
-                    Polyline(
-                        (0, hl),
-                        (0, cutw + cutl),
-                        (cutw, cutl),
-                        (cutw, 0),
-                        (opening_width - cutw, 0),
-                        (opening_width - cutw, cutl),
-                        (opening_width, cutl + cutw),
-                        (opening_width, hl),
-                    )
-                    ThreePointArc(
-                        (opening_width, hl),
-                        (opening_width / 2, hl + opening_width / 2),
-                        (0, hl),
-                    )
-                make_face()
-                fillet(
-                    sk.vertices()
-                    .sort_by(Axis.Y)
-                    .filter_by_position(
-                        Axis.Y, 0, hl, inclusive=(False, False)
-                    ),
-                    radius=cutw,
-                )
-                mirror(sk.sketch, about=Plane.XZ)
+            add(copy(_dispenser_cutout_outline()))
             extrude(amount=radius * 2)
         if not p.part:
             raise RuntimeError("Empty part")
@@ -184,6 +195,7 @@ class PoopBagDispenserWallMount(Model):
     thickness: float = Inches(1 / 8 + 1 / 32)
     screw_size: float = Inches(3 / 16)
 
+    @cached_build()
     def build(self) -> Model.Geometry:
         with BuildPart() as p:
             DispenserBody(
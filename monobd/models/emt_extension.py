@@ -1,20 +1,6 @@
 from __future__ import annotations
 
 from bdbox import Inches, Model
-from build123d import (
-    IN,
-    Align,
-    Axis,
-    BuildPart,
-    BuildSketch,
-    Circle,
-    Color,
-    Cylinder,
-    Mode,
-    Plane,
-    chamfer,
-    loft,
-)
 
 
 class EMTExtension(Model):
@@ -25,6 +11,21 @@ class EMTExtension(Model):
     slop: float = Inches(1 / 32)
 
     def build(self) -> Model.Geometry:
+        from build123d import (  # noqa: PLC0415
+            IN,
+            Align,
+            Axis,
+            BuildPart,
+            BuildSketch,
+            Circle,
+            Color,
+            Cylinder,
+            Mode,
+            Plane,
+            chamfer,
+            loft,
+        )
+
         with BuildPart() as p:
             with BuildSketch():
                 Circle(self.diameter + 1 / 4 * IN * 0)
@@ -1,16 +1,6 @@
 from __future__ import annotations
 
 from bdbox import Model, Preset
-from build123d import (
-    Align,
-    Box,
-    BuildPart,
-    Color,
-    Compound,
-    Locations,
-    chamfer,
-    fillet,
-)
 
 
 class ExampleModel(Model):
@@ -18,6 +8,17 @@ class ExampleModel(Model):
     presets = (Preset("tall", height_factor=2),)
 
     def build(self) -> Model.Geometry:
+        from build123d import (  # noqa: PLC0415
+            Align,
+            Box,
+            BuildPart,
+            Color,
+            Compound,
+            Locations,
+            chamfer,
+            fillet,
+        )
+
         with BuildPart() as p:
             Box(
                 10,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import math
+from copy import copy
+from functools import lru_cache
 
 from bdbox import Choice, Inches, Int, Model, Preset
 from build123d import (
@@ -22,12 +24,40 @@ from build123d import (
     Mode,
     Polyline,
     RotationLike,
+    Sketch,
     chamfer,
     extrude,
     fillet,
     make_face,
 )
 
+from monobd.cache import cached_build
+
+
+@lru_cache(maxsize=16)
+def _handle_outline(
+    length: float,
+    height: float,
+    angle: float,
+    resize: float,
+    adjust_for_thickness: float,
+) -> Sketch:
+    tan_angle = math.tan(math.radians(angle))
+    with BuildSketch() as sk:
+        with BuildLine():
+            sub = (height + resize) * tan_angle
+            lengthsub = -adjust_for_thickness * tan_angle
+            Line((-resize, 0), (length + lengthsub + resize, 0))
+            ln = Polyline(
+                (length + lengthsub + resize, 0),
+                (length + lengthsub + resize - sub, height + resize),
+                (-resize + sub, height + resize),
+                (-resize, 0),
+            )
+            fillet(ln.vertices()[1:-1], radius=height / 2 + resize)
+        make_face()
+    return sk.sketch
+
 
 class HandleOutline(BaseSketchObject):
     def __init__(
@@ -41,27 +71,11 @@ class HandleOutline(BaseSketchObject):
         align: tuple[Align, Align] = (Align.CENTER, Align.MIN),
         mode: Mode = Mode.ADD,
     ) -> None:
-        with BuildSketch() as sk:
-            with BuildLine():
-                sub = (height + resize) * math.tan(angle * (math.pi / 180))
-                lengthsub = 0.0
-                if adjust_for_thickness:
-                    lengthsub = (
-                        -adjust_for_thickness
-                        / 1
-                        * math.tan(angle * (math.pi / 180))
-                    )
-                Line((-resize, 0), (length + lengthsub + resize, 0))
-                ln = Polyline(
-                    (length + lengthsub + resize, 0),
-                    (length + lengthsub + resize - sub, height + resize),
-                    (-resize + sub, height + resize),
-                    (-resize, 0),
-                )
-                fillet(ln.vertices()[1:-1], radius=height / 2 + resize)
-            make_face()
+        outline = _handle_outline(
+            length, height, angle, resize, adjust_for_thickness
+        )
         super().__init__(
-            obj=sk.sketch, rotation=rotation, align=align, mode=mode
+            obj=copy(outline), rotation=rotation, align=align, mode=mode
         )
 
 
@@ -133,6 +147,7 @@ class ScrewHandle(Model):
         Preset("thin", screw_size=(9 / 64), thickness=(9 / IN) * MM),
     )
 
+    @cached_build()
     def build(self) -> Model.Geometry:
         with BuildPart() as p:
             HandleBody(
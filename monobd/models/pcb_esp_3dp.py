@@ -14,6 +14,7 @@ from build123d import (
     Circle,
     Color,
     CounterSinkHole,
+    GeomType,
     GridLocations,
     Hole,
     Locations,
@@ -30,7 +31,8 @@ from build123d import (
     make_hull,
 )
 
-from monobd.objects import HexagonPattern
+from monobd.cache import cached_build
+from monobd.objects import HexagonPattern, hexagons
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -133,14 +135,16 @@ class ScrewPylon(BasePartObject):
             bottom_sz = grid.screw_inset * 4 + grid.grid_spacing + aw + bw
             top_sz = grid.screw_inset * 4 + grid.grid_spacing + aw
             radius = 3 + aw / 2
-            with BuildSketch():
-                RectangleRounded(bottom_sz, bottom_sz, radius)
-            extrude(amount=base_thickness)
-            with BuildSketch(Plane.XY.offset(base_thickness)):
-                RectangleRounded(bottom_sz, bottom_sz, radius)
-            with BuildSketch(Plane.XY.offset(base_thickness + pylon_height)):
-                RectangleRounded(top_sz, top_sz, radius)
-            loft()
+            # A ruled loft through the base and top sections builds the
+            # straight base and the tapered pylon without fusing two solids
+            for z, sz in (
+                (0, bottom_sz),
+                (base_thickness, bottom_sz),
+                (base_thickness + pylon_height, top_sz),
+            ):
+                with BuildSketch(Plane.XY.offset(z)):
+                    RectangleRounded(sz, sz, radius)
+            loft(ruled=True)
 
         if not p.part:
             raise RuntimeError("Empty part")
@@ -267,9 +271,10 @@ class ESP3DP(Model, PCBGrid):
             return self.edge_chamfer
         raise Exception(f"Unknown base style {self.base_style}")  # noqa: TRY002
 
+    @cached_build(hexagons.__file__)
     def build(self) -> Model.Geometry:
         with BuildPart() as p:
-            with BuildSketch():
+            with BuildSketch() as sk:
                 RectangleRounded(
                     self.x + self.border * 2,
                     self.y + self.border * 2,
@@ -277,7 +282,9 @@ class ESP3DP(Model, PCBGrid):
                 )
                 with self.mounting_screw_locations:
                     Circle(radius=(self.mounting_screw_hole_d / 2) * 3)
-                make_hull()
+                # The hull touches only the rounded corners and screw circles,
+                # and make_hull samples every edge it is given
+                make_hull(sk.edges().filter_by(GeomType.CIRCLE))
             extrude(amount=self.base_thickness)
             chamfer(
                 p.edges().filter_by(Plane.XY).group_by(Axis.Z)[-1],
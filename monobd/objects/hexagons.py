@@ -1,27 +1,79 @@
 import math
-from functools import cached_property
+from functools import cached_property, lru_cache
 
 from build123d import (
     Align,
     BaseSketchObject,
-    BoundBox,
     BuildSketch,
+    Face,
     HexLocations,
     Location,
-    Locations,
     Mode,
-    Rectangle,
     RegularPolygon,
+    Sketch,
 )
 
+DEFAULT_HEX_SIZE = 8
+DEFAULT_HEX_SPACING = 1.4
+
+
+@lru_cache(maxsize=32)
+def _hex_positions(
+    radius: float, x_count: int, y_count: int
+) -> tuple[tuple[float, float], ...]:
+    return tuple(
+        (loc.position.X, loc.position.Y)
+        for loc in HexLocations(
+            radius=radius, x_count=x_count, y_count=y_count, major_radius=True
+        ).local_locations
+    )
+
+
+def _hex_count(length: float, hex_size: float, hex_spacing: float) -> int:
+    return math.ceil(length / (hex_size * 1.5 + hex_spacing))
+
+
+@lru_cache(maxsize=64)
+def _pattern_positions(
+    width: float,
+    height: float,
+    hex_size: float,
+    hex_spacing: float,
+    *,
+    whole_only: bool,
+) -> tuple[tuple[float, float], ...]:
+    if hex_size <= 0:
+        return ()
+    x_count = _hex_count(width, hex_size, hex_spacing)
+    y_count = _hex_count(height, hex_size, hex_spacing)
+    if min(x_count, y_count) < 1:
+        return ()
+    positions = _hex_positions(hex_size + hex_spacing, x_count, y_count)
+    if not whole_only:
+        return positions
+    # A hexagon with a vertex on the X axis spans its radius along X and its
+    # apothem along Y
+    max_x = width / 2 - hex_size
+    max_y = height / 2 - hex_size * math.sqrt(3) / 2
+    return tuple(
+        (x, y) for x, y in positions if abs(x) < max_x and abs(y) < max_y
+    )
+
+
+@lru_cache(maxsize=8)
+def _hexagon(radius: float) -> Sketch:
+    with BuildSketch() as sk:
+        RegularPolygon(radius=radius, side_count=6)
+    return sk.sketch
+
 
 class HexagonPattern(BaseSketchObject):
     def __init__(
         self,
         width: float,
         height: float,
-        hex_size: float = 8,
-        hex_spacing: float = 1.4,
+        hex_size: float = DEFAULT_HEX_SIZE,
+        hex_spacing: float = DEFAULT_HEX_SPACING,
         rotation: float = 0,
         align: tuple[Align, Align] = (Align.CENTER, Align.CENTER),
         mode: Mode = Mode.ADD,
@@ -33,48 +85,58 @@ class HexagonPattern(BaseSketchObject):
         self.hex_size = hex_size
         self.hex_spacing = hex_spacing
         self.whole_only = whole_only
-        with BuildSketch() as sk:
-            with Locations(self.locations):
-                RegularPolygon(radius=hex_size, side_count=6)
-            Rectangle(width, height, mode=Mode.INTERSECT)
+        if not self.locations:
+            kind = "whole hexagons" if whole_only else "hexagons"
+            raise ValueError(
+                f"No {kind} of size {hex_size} fit in a {width} x {height}"
+                " pattern"
+            )
+        # The hexagons never overlap, so copies of one hexagon are clipped to
+        # the pattern area together without first fusing them
+        pattern = Sketch(
+            [_hexagon(hex_size).moved(loc) for loc in self.locations]
+        )
         super().__init__(
-            obj=sk.sketch, rotation=rotation, align=align, mode=mode
+            obj=pattern & Face.make_rect(width, height),
+            rotation=rotation,
+            align=align,
+            mode=mode,
+        )
+
+    @classmethod
+    def fits(
+        cls,
+        width: float,
+        height: float,
+        hex_size: float = DEFAULT_HEX_SIZE,
+        hex_spacing: float = DEFAULT_HEX_SPACING,
+        *,
+        whole_only: bool = False,
+    ) -> bool:
+        """Return whether a pattern of this size contains any hexagons."""
+        return bool(
+            _pattern_positions(
+                width, height, hex_size, hex_spacing, whole_only=whole_only
+            )
         )
 
     @cached_property
     def locations(self) -> list[Location]:
-        all_hex_locations = HexLocations(
-            radius=self.hex_size + self.hex_spacing,
-            x_count=self.x_count,
-            y_count=self.y_count,
-            major_radius=True,
-        )
-        if not self.whole_only:
-            return all_hex_locations.locations
-        rect = Rectangle(self._width, self._height, mode=Mode.PRIVATE)
-        whole_hex_locations = []
-        for loc in all_hex_locations:
-            with Locations(loc):
-                rp = RegularPolygon(
-                    radius=self.hex_size, side_count=6, mode=Mode.PRIVATE
-                )
-                if (
-                    BoundBox.find_outside_box_2d(
-                        rp.bounding_box(), rect.bounding_box()
-                    )
-                    is not None
-                ):
-                    whole_hex_locations.append(loc)
-        return whole_hex_locations
+        return [
+            Location((x, y, 0))
+            for x, y in _pattern_positions(
+                self._width,
+                self._height,
+                self.hex_size,
+                self.hex_spacing,
+                whole_only=self.whole_only,
+            )
+        ]
 
     @cached_property
     def x_count(self) -> int:
-        return math.ceil(
-            self._width / (self.hex_size * 1.5 + self.hex_spacing)
-        )
+        return _hex_count(self._width, self.hex_size, self.hex_spacing)
 
     @cached_property
     def y_count(self) -> int:
-        return math.ceil(
-            self._height / (self.hex_size * 1.5 + self.hex_spacing)
-        )
+        return _hex_count(self._height, self.hex_size, self.hex_spacing)
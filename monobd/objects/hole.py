@@ -1,14 +1,18 @@
+from math import sqrt
+
 from build123d import (
     Align,
     Axis,
     BasePartObject,
     BuildPart,
     BuildSketch,
-    Circle,
     CounterBoreHole,
+    Edge,
+    Face,
     Mode,
-    Rectangle,
     RotationLike,
+    Wire,
+    add,
     extrude,
     validate_inputs,
 )
@@ -43,13 +47,26 @@ class PrintableCounterBoreHole(BasePartObject):
                 depth=depth,
                 mode=Mode.ADD,
             )
-            with BuildSketch(p.faces().sort_by(Axis.Z)[2]) as sk:
-                Circle(radius=counter_bore_radius)
-                Rectangle(
-                    counter_bore_radius,
-                    counter_bore_radius * 2,
-                    mode=Mode.SUBTRACT,
+            # Circular segments either side of a center strip half the
+            # counter bore wide, drawn directly rather than cut from a disc
+            chord_x = counter_bore_radius / 2
+            chord_y = counter_bore_radius * sqrt(3) / 2
+            segment = Face(
+                Wire(
+                    [
+                        Edge.make_three_point_arc(
+                            (chord_x, -chord_y),
+                            (counter_bore_radius, 0),
+                            (chord_x, chord_y),
+                        ),
+                        Edge.make_line(
+                            (chord_x, chord_y), (chord_x, -chord_y)
+                        ),
+                    ]
                 )
+            )
+            with BuildSketch(p.faces().sort_by(Axis.Z)[2]) as sk:
+                add([segment, segment.rotate(Axis.Z, 180)])
             extrude(sk.sketch, amount=-0.4, mode=Mode.SUBTRACT)
         if not p.part:
             raise RuntimeError("Empty part")
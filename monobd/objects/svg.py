@@ -1,18 +1,46 @@
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
 
 from build123d import (
     Align,
     BaseSketchObject,
     BuildSketch,
+    Compound,
+    Face,
     Mode,
     Plane,
-    add,
+    Sketch,
+    Wire,
     import_svg,
     mirror,
     scale,
 )
 
 
+# Cached geometry is keyed on the file's modification time as well as its
+# name, so that edits to an SVG are picked up within the same process
+@lru_cache(maxsize=32)
+def _import_svg(
+    file_name: str,
+    mtime_ns: int,  # noqa: ARG001
+) -> tuple[Wire | Face, ...]:
+    return tuple(import_svg(file_name))
+
+
+@lru_cache(maxsize=64)
+def _svg_sketch(
+    file_name: str, mtime_ns: int, size: float, *, flip_x: bool
+) -> Sketch:
+    with BuildSketch() as sk:
+        ep = [copy(shape) for shape in _import_svg(file_name, mtime_ns)]
+        if flip_x:
+            ep = mirror(ep, about=Plane.YZ, mode=Mode.PRIVATE)
+        bbox_size = Compound(ep).bounding_box().size
+        ep = scale(ep, by=(size / max(bbox_size.X, bbox_size.Y)))
+    return sk.sketch
+
+
 class SVGSketch(BaseSketchObject):
     def __init__(
         self,
@@ -24,14 +52,15 @@ class SVGSketch(BaseSketchObject):
         *,
         flip_x: bool = True,
     ) -> None:
-        with BuildSketch() as sk:
-            ep = import_svg(str(file_name))
-            if flip_x:
-                ep = mirror(ep, about=Plane.YZ, mode=Mode.PRIVATE)
-            add(ep)
-            bbox = sk.sketch.bounding_box()
-            max_dim = max(bbox.size.Y, bbox.size.X)
-            ep = scale(ep, by=(size / max_dim))
+        sketch = _svg_sketch(
+            str(file_name),
+            Path(file_name).stat().st_mtime_ns,
+            size,
+            flip_x=flip_x,
+        )
         super().__init__(
-            obj=sk.sketch, rotation=rotation, align=align, mode=mode
+            obj=copy(sketch),
+            rotation=rotation,
+            align=align,
+            mode=mode,
         )
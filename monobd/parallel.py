@@ -0,0 +1,113 @@
+"""Build independent geometry concurrently in worker processes."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from build123d import Color, Compound, Location, export_brep, import_brep
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from build123d import Shape
+
+_in_builder: ContextVar[bool] = ContextVar("_in_builder", default=False)
+
+
+@dataclass
+class ShapeState:
+    """Picklable snapshot of a shape tree.
+
+    Leaves are stored as BREP text, which unlike OCCT's binary format
+    round-trips every geometry type exactly. Inner nodes keep their own
+    placement and children. Labels and colors are preserved.
+    """
+
+    label: str
+    color: tuple[float, ...] | None = None
+    brep: bytes | None = None
+    position: tuple[float, float, float] = (0, 0, 0)
+    orientation: tuple[float, float, float] = (0, 0, 0)
+    children: tuple[ShapeState, ...] = ()
+
+    @classmethod
+    def dump(cls, shape: Shape) -> ShapeState:
+        color = tuple(shape.color) if shape.color is not None else None
+        if not (children := getattr(shape, "children", ())):
+            buffer = BytesIO()
+            export_brep(shape, buffer)
+            return cls(shape.label, color, brep=buffer.getvalue())
+        position, orientation = shape.location or Location()
+        return cls(
+            shape.label,
+            color,
+            position=(position.X, position.Y, position.Z),
+            orientation=(orientation.X, orientation.Y, orientation.Z),
+            children=tuple(cls.dump(child) for child in children),
+        )
+
+    def load(self) -> Shape:
+        if self.brep is not None:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                path = Path(temp_dir) / "shape.brep"
+                path.write_bytes(self.brep)
+                shape = import_brep(path)
+            shape.label = self.label
+        else:
+            shape = Compound(
+                label=self.label,
+                children=[child.load() for child in self.children],
+            )
+            shape.location = Location(self.position, self.orientation)
+        if self.color is not None:
+            shape.color = Color(*self.color)
+        return shape
+
+
+def build_parallel(
+    builders: Sequence[Callable[[], Shape]], max_workers: int | None = None
+) -> list[Shape]:
+    """Call each builder and return the built shapes in order.
+
+    The first builder runs in the calling process while the rest run in
+    worker processes, so builders must be picklable (module-level callables
+    or ``functools.partial`` objects wrapping them). Shapes built by workers
+    are returned as plain ``Compound`` trees with labels, colors and
+    placement intact. Calls made from within a builder run serially, so
+    nested builds do not start further worker processes.
+
+    Args:
+        builders: Callables that each build and return one shape.
+        max_workers: Worker process count. Defaults to one less than the
+            number of CPUs. With no workers, all builders run serially in
+            the calling process.
+    """
+    if max_workers is None:
+        max_workers = min(len(builders), os.cpu_count() or 1) - 1
+    if max_workers < 1 or len(builders) < 2 or _in_builder.get():
+        return [build() for build in builders]
+    first, *rest = builders
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_build_state, build) for build in rest]
+        shapes = [_build(first)]
+        shapes.extend(future.result().load() for future in futures)
+    return shapes
+
+
+def _build(build: Callable[[], Shape]) -> Shape:
+    token = _in_builder.set(True)
+    try:
+        return build()
+    finally:
+        _in_builder.reset(token)
+
+
+def _build_state(build: Callable[[], Shape]) -> ShapeState:
+    return ShapeState.dump(_build(build))
@@ -0,0 +1,67 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from build123d import Align, Box, Compound, Location, Shape
+
+from monobd import cache
+from monobd.models.avrack import constants
+from monobd.models.avrack.frame import _build_frame_halves
+from monobd.models.avrack.model import AVRack
+from monobd.models.avrack.tray import RackTrayBody
+
+
+def test_avrack_rebuild(
+    temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("MONOBD_CACHE_DIR", str(temp_dir))
+    build_counts = []
+
+    def build_parallel(builders: list[Callable[[], Shape]]) -> list[Shape]:
+        build_counts.append(len(builders))
+        return [build() for build in builders]
+
+    monkeypatch.setattr(cache, "build_parallel", build_parallel)
+    model = AVRack(simple=True)
+    _build_frame_halves.cache_clear()
+    model.build()
+    assert build_counts == [2, 3]
+    assert len(list(temp_dir.iterdir())) == 5
+
+    # Rebuild with both frame halves and trays loaded from the disk cache
+    build_counts.clear()
+    _build_frame_halves.cache_clear()
+    assembly = model.build()
+    assert build_counts == [0, 0]
+    assert isinstance(assembly, Compound)
+    _, trays = assembly.children
+    assert [t.label for t in trays.children] == [
+        "ethernet-switch",
+        "roku",
+        "hdmi-duplicator",
+    ]
+
+
+@pytest.mark.parametrize("device_size", [(19, 20, 60), (30, 20, 60)])
+def test_tray_body_too_small_for_side_hexagons(
+    device_size: tuple[float, float, float],
+) -> None:
+    body = RackTrayBody(device_size)
+    assert body.volume > 0
+
+
+def test_tray_body_short_device_end_hexagons() -> None:
+    def end_wall_volume(body: RackTrayBody) -> float:
+        bb = body.bounding_box()
+        end_wall = Box(
+            constants.WALL_THICKNESS,
+            bb.size.Y,
+            bb.size.Z,
+            align=(Align.MAX, Align.MIN, Align.MIN),
+        ).moved(Location((bb.max.X, bb.min.Y, bb.min.Z)))
+        return (body & end_wall).volume
+
+    # Partial hexagons are cut from end faces too short for a whole one
+    assert end_wall_volume(RackTrayBody((40, 8, 60))) < end_wall_volume(
+        RackTrayBody((40, 8, 60), hexagon_pattern=False)
+    )
@@ -0,0 +1,108 @@
+import pickle
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import pytest
+from bdbox import Model
+from build123d import Box, Part, Shape
+
+from monobd import cache
+from monobd.cache import CacheEntry, cached_build, load_or_build
+from monobd.parallel import ShapeState
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("MONOBD_CACHE_DIR", str(temp_dir / "cache"))
+    return temp_dir / "cache"
+
+
+def test_load_or_build(temp_dir: Path, cache_dir: Path) -> None:
+    dependency = temp_dir / "source.py"
+    dependency.write_text("size = 2")
+    built = []
+
+    def build() -> Shape:
+        built.append(True)
+        part = Box(2, 3, 4)
+        part.label = "box"
+        return part
+
+    first = load_or_build("box", build, [dependency])
+    second = load_or_build("box", build, [dependency])
+    assert len(built) == 1
+    assert len(list(cache_dir.iterdir())) == 1
+    assert second.label == first.label == "box"
+    assert list(second.bounding_box().size) == pytest.approx([2, 3, 4])
+
+    load_or_build("other", build, [dependency])
+    assert len(built) == 2
+    dependency.write_text("size = 3")
+    load_or_build("box", build, [dependency])
+    assert len(built) == 3
+
+
+def test_load_or_build_all(monkeypatch: pytest.MonkeyPatch) -> None:
+    build_counts = []
+
+    def build_parallel(builders: list[Callable[[], Shape]]) -> list[Shape]:
+        build_counts.append(len(builders))
+        return [build() for build in builders]
+
+    monkeypatch.setattr(cache, "build_parallel", build_parallel)
+    entries = [
+        CacheEntry(length, partial(Box, length, 3, 4)) for length in (1, 2)
+    ]
+    cache.load_or_build_all(entries[:1])
+    shapes = cache.load_or_build_all(entries)
+    assert [s.bounding_box().size.X for s in shapes] == pytest.approx([1, 2])
+    cache.load_or_build_all(entries)
+    assert build_counts == [1, 1, 0]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b"invalid", id="corrupt"),
+        pytest.param(
+            pickle.dumps(ShapeState("box", brep=b"invalid")), id="stale"
+        ),
+    ],
+)
+def test_load_or_build_invalid_entry(data: bytes) -> None:
+    entry = CacheEntry("box", partial(Box, 1, 2, 3))
+    entry.path.parent.mkdir(parents=True)
+    entry.path.write_bytes(data)
+    shape = load_or_build(entry.key, entry.build)
+    assert list(shape.bounding_box().size) == pytest.approx([1, 2, 3])
+    assert entry.path.read_bytes() != data
+
+
+def test_load_or_build_disabled(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("MONOBD_NO_CACHE", "1")
+    load_or_build("box", partial(Box, 1, 2, 3))
+    assert not cache_dir.exists()
+
+
+box_builds: list[float] = []
+
+
+class CachedBox(Model):
+    length: float = 2
+
+    @cached_build()
+    def build(self) -> Part:
+        box_builds.append(self.length)
+        return Box(self.length, 3, 4)
+
+
+def test_cached_build() -> None:
+    first = CachedBox().build()
+    second = CachedBox().build()
+    assert box_builds == [2]
+    assert second.volume == pytest.approx(first.volume)
+    assert CachedBox(length=5).build().volume == pytest.approx(60)
+    assert box_builds == [2, 5]
@@ -0,0 +1,59 @@
+import os
+from functools import partial
+
+import pytest
+from build123d import Box, Color, Compound, Location, Part
+
+from monobd.parallel import build_parallel
+
+
+def box(length: float, label: str) -> Part:
+    part = Box(length, 2, 3)
+    part.label = label
+    return part
+
+
+def assembly() -> Compound:
+    inner = box(4, "inner").move(Location((10, 0, 0)))
+    inner.color = Color(0xFF8822)
+    outer = Compound(label="assembly", children=[box(1, "outer"), inner])
+    return outer.move(Location((0, 5, 0), (0, 0, 90)))
+
+
+def pid_box() -> Part:
+    return box(1, str(os.getpid()))
+
+
+def nested() -> Compound:
+    return Compound(
+        label="nested",
+        children=build_parallel([pid_box, pid_box], max_workers=1),
+    )
+
+
+@pytest.mark.parametrize(
+    "max_workers",
+    [pytest.param(0, id="serial"), pytest.param(1, id="worker")],
+)
+def test_build_parallel(max_workers: int) -> None:
+    expected = [box(1, "first"), assembly()]
+    shapes = build_parallel(
+        [partial(box, 1, "first"), assembly], max_workers=max_workers
+    )
+    assert [s.label for s in shapes] == ["first", "assembly"]
+    assert [c.label for c in shapes[1].children] == ["outer", "inner"]
+    assert tuple(shapes[1].children[1].color) == pytest.approx(
+        tuple(Color(0xFF8822))
+    )
+    for shape, expected_shape in zip(shapes, expected, strict=True):
+        assert isinstance(shape, Compound)
+        assert shape.volume == pytest.approx(expected_shape.volume)
+        assert list(shape.bounding_box().min) == pytest.approx(
+            list(expected_shape.bounding_box().min)
+        )
+
+
+def test_build_parallel_nested() -> None:
+    shapes = build_parallel([nested, pid_box], max_workers=1)
+    assert [c.label for c in shapes[0].children] == [str(os.getpid())] * 2
+    assert shapes[1].label != str(os.getpid())